@@ -8,36 +8,198 @@ https://{district}.api.nutrislice.com/menu/api/weeks/school/{school-slug}/menu-t
 """
 
 import argparse
+import datetime as dt
+import heapq
 import json
+import os
+import re
 import sys
-from datetime import datetime, timedelta
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+MENU_TYPES = ("breakfast", "lunch")
+
+# Section titles containing this (any case) mark entree items
+_ENTREE_RE = re.compile(r"entree", re.IGNORECASE)
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Upper bound on concurrent menu fetches (a full week is 5 days x 2 menus)
+MAX_WORKERS = 10
+
+
+@cache
+def _requests():
+    """Import requests on first use.
+
+    requests (and urllib3 under it) is the bulk of startup time, so deferring
+    it keeps --help and argument errors fast.
+    """
+    import requests
+    import requests.adapters
+    return requests
+
+
+def json_loads(data: bytes):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Encode obj as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def cache_dir() -> Path:
+    """Directory for on-disk API response caches (honors XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "nutrislice"
 
 
 class NutrisliceClient:
     """Client for fetching school menus from Nutrislice API."""
 
-    def __init__(self, district: str):
+    def __init__(self, district: str, use_cache: bool = True):
         self.district = district
         self.base_url = f"https://{district}.api.nutrislice.com"
+        self.use_cache = use_cache
         self._schools_cache: list[dict] | None = None
+        self._slug_index: dict[str, dict] = {}
+        self._slugs: list[str] = []
+        self._name_lower: list[tuple[str, dict]] = []
+
+        # One pooled session so repeated fetches to the district host reuse
+        # keep-alive connections instead of re-handshaking each time. All
+        # requests go to a single host, and the pool holds one connection per
+        # concurrent fetch so none are opened and then thrown away.
+        requests = _requests()
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS),
+        )
+        # requests' default Accept-Encoding already includes "br" whenever a
+        # brotli package is installed (see the "fast" extra).
+        self._session.headers.update({
+            "User-Agent": "nutrislice-menu",
+            "Accept": "application/json",
+        })
+
+    def close(self) -> None:
+        """Release any pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "NutrisliceClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def fetch_schools(self) -> list[dict]:
-        """Fetch list of schools for this district from the API."""
+        """Fetch list of schools for this district from the API.
+
+        The response is cached on disk and revalidated with
+        If-None-Match/If-Modified-Since, so repeat runs usually get a 304.
+        """
         if self._schools_cache is not None:
             return self._schools_cache
 
         url = f"{self.base_url}/menu/api/schools"
+        cached = self._read_schools_cache() if self.use_cache else None
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            self._schools_cache = response.json()
-            return self._schools_cache
-        except requests.RequestException as e:
+            response = self._session.get(url, headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                schools = cached["schools"]
+            else:
+                response.raise_for_status()
+                schools = json_loads(response.content)
+                if self.use_cache:
+                    self._write_schools_cache(response, schools)
+        except (_requests().RequestException, ValueError) as e:
             print(f"Error fetching schools for district '{self.district}': {e}", file=sys.stderr)
             return []
 
+        self._schools_cache = schools
+        self._index_schools(schools)
+        return schools
+
+    def _schools_cache_path(self) -> Path:
+        return cache_dir() / f"{self.district}-schools.json"
+
+    def _read_schools_cache(self) -> dict | None:
+        """Load the cached schools response, or None if missing/unreadable."""
+        try:
+            cached = json_loads(self._schools_cache_path().read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or not isinstance(cached.get("schools"), list):
+            return None
+        # Treat entries resolve_school can't index as a miss, so a bad file
+        # gets replaced by a fresh download instead of failing every run
+        for school in cached["schools"]:
+            if not (
+                isinstance(school, dict)
+                and isinstance(school.get("slug"), str)
+                and isinstance(school.get("name"), str)
+            ):
+                return None
+        return cached
+
+    def _write_schools_cache(self, response: "requests.Response", schools: list[dict]) -> None:
+        """Atomically store the schools response with its validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return  # Nothing to revalidate against
+
+        path = self._schools_cache_path()
+        payload = json_dumps({"etag": etag, "last_modified": last_modified, "schools": schools})
+        tmp = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, delete=False
+            ) as tmp:
+                tmp.write(payload)
+            os.replace(tmp.name, path)
+        except OSError:
+            # A cache we can't write is just a slower next run, but don't
+            # leave the partial temp file behind
+            if tmp is not None:
+                try:
+                    os.unlink(tmp.name)
+                except OSError:
+                    pass
+
+    def _index_schools(self, schools: list[dict]) -> None:
+        """Build the lookup tables used by resolve_school."""
+        self._slug_index = {s["slug"]: s for s in schools}
+        self._slugs = list(self._slug_index)
+        self._name_lower = [(s["name"].lower(), s) for s in schools]
+
     def resolve_school(self, query: str) -> str | None:
         """Resolve a partial school name to the full slug.
 
@@ -56,48 +218,54 @@ class NutrisliceClient:
         query_lower = query.lower().strip()
 
         # Try exact match first
-        for school in schools:
-            if school["slug"] == query_lower:
-                return school["slug"]
+        if query_lower in self._slug_index:
+            return query_lower
+
+        # Try prefix and substring match in slug (single pass; every
+        # prefix match is also a substring match)
+        prefix_matches = []
+        substring_matches = []
+        for slug in self._slugs:
+            if query_lower in slug:
+                substring_matches.append(slug)
+                if slug.startswith(query_lower):
+                    prefix_matches.append(slug)
 
-        # Try prefix match
-        prefix_matches = [s for s in schools if s["slug"].startswith(query_lower)]
         if len(prefix_matches) == 1:
-            return prefix_matches[0]["slug"]
-
-        # Try substring match in slug
-        substring_matches = [s for s in schools if query_lower in s["slug"]]
+            return prefix_matches[0]
         if len(substring_matches) == 1:
-            return substring_matches[0]["slug"]
+            return substring_matches[0]
 
         # Try substring match in name
-        name_matches = [s for s in schools if query_lower in s["name"].lower()]
+        name_matches = [s["slug"] for name, s in self._name_lower if query_lower in name]
         if len(name_matches) == 1:
-            return name_matches[0]["slug"]
+            return name_matches[0]
 
-        # Multiple matches - show them to the user
-        all_matches = list({s["slug"] for s in prefix_matches + substring_matches + name_matches})
+        # Multiple matches - show them to the user. Prefix matches are a
+        # subset of substring matches, so those two sources cover them all.
+        all_matches = set(substring_matches)
+        all_matches.update(name_matches)
         if all_matches:
             print(f"Ambiguous school name '{query}'. Did you mean one of these?", file=sys.stderr)
-            for slug in sorted(all_matches)[:10]:
-                school = next(s for s in schools if s["slug"] == slug)
+            for slug in heapq.nsmallest(10, all_matches):
+                school = self._slug_index[slug]
                 print(f"  {slug:40} ({school['name']})", file=sys.stderr)
             return None
 
         return None
 
-    def get_menu_url(self, school: str, menu_type: str, date: datetime) -> str:
+    def get_menu_url(self, school: str, menu_type: str, date: dt.date) -> str:
         """Build the API URL for a specific school, menu type, and date."""
         return f"{self.base_url}/menu/api/weeks/school/{school}/menu-type/{menu_type}/{date.year}/{date.month:02d}/{date.day:02d}/"
 
-    def fetch_menu(self, school: str, menu_type: str, date: datetime) -> dict:
+    def fetch_menu(self, school: str, menu_type: str, date: dt.date) -> dict:
         """Fetch menu data from the API."""
         url = self.get_menu_url(school, menu_type, date)
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return json_loads(response.content)
+        except (_requests().RequestException, ValueError) as e:
             print(f"Error fetching {menu_type} menu: {e}", file=sys.stderr)
             return {}
 
@@ -105,17 +273,21 @@ class NutrisliceClient:
         """Extract menu item names for a specific date (deduplicated)."""
         items = []
         seen = set()
+        items_append = items.append
+        seen_add = seen.add
         for day in data.get("days", []):
-            if day.get("date") == target_date:
-                for item in day.get("menu_items", []):
-                    if item.get("is_section_title"):
-                        continue
-                    food = item.get("food")
-                    if food:
-                        name = food.get("name")
-                        if name and name not in seen:
-                            seen.add(name)
-                            items.append(name)
+            if day.get("date") != target_date:
+                continue
+            for item in day.get("menu_items", []):
+                if item.get("is_section_title"):
+                    continue
+                food = item.get("food")
+                name = food.get("name") if food else None
+                if name and name not in seen:
+                    seen_add(name)
+                    items_append(name)
+            # Each week has at most one entry per date
+            break
         return items
 
     def get_entrees_only(self, data: dict, target_date: str) -> list[str]:
@@ -125,34 +297,77 @@ class NutrisliceClient:
         """
         items = []
         seen = set()
+        items_append = items.append
+        seen_add = seen.add
         for day in data.get("days", []):
-            if day.get("date") == target_date:
-                in_entree_section = False
-                for item in day.get("menu_items", []):
-                    if item.get("is_section_title"):
-                        section_text = item.get("text", "").upper()
-                        in_entree_section = "ENTREE" in section_text
-                        continue
-                    if in_entree_section:
-                        food = item.get("food")
-                        if food:
-                            name = food.get("name")
-                            if name and name not in seen:
-                                seen.add(name)
-                                items.append(name)
+            if day.get("date") != target_date:
+                continue
+            in_entree_section = False
+            for item in day.get("menu_items", []):
+                if item.get("is_section_title"):
+                    in_entree_section = _ENTREE_RE.search(item.get("text") or "") is not None
+                    continue
+                if not in_entree_section:
+                    continue
+                food = item.get("food")
+                name = food.get("name") if food else None
+                if name and name not in seen:
+                    seen_add(name)
+                    items_append(name)
+            # Each week has at most one entry per date
+            break
         return items
 
     def get_daily_menu(
         self,
         school: str,
-        date: datetime,
+        date: dt.date,
         entrees_only: bool = False
     ) -> dict:
         """Get both breakfast and lunch menus for a specific date."""
-        date_str = date.strftime("%Y-%m-%d")
-
         breakfast_data = self.fetch_menu(school, "breakfast", date)
         lunch_data = self.fetch_menu(school, "lunch", date)
+        return self._build_daily_menu(date, breakfast_data, lunch_data, entrees_only)
+
+    def get_menus(
+        self,
+        school: str,
+        dates: list[dt.date],
+        entrees_only: bool = False
+    ) -> list[dict]:
+        """Get breakfast and lunch menus for several dates.
+
+        All menu requests are independent, so they are issued concurrently
+        over the pooled session and the results returned in date order.
+        """
+        keys = [(date, menu_type) for date in dates for menu_type in MENU_TYPES]
+        workers = min(len(keys), MAX_WORKERS) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(self.fetch_menu, school, key[1], key[0])
+                for key in keys
+            }
+            results = {key: future.result() for key, future in futures.items()}
+
+        return [
+            self._build_daily_menu(
+                date,
+                results[(date, "breakfast")],
+                results[(date, "lunch")],
+                entrees_only,
+            )
+            for date in dates
+        ]
+
+    def _build_daily_menu(
+        self,
+        date: dt.date,
+        breakfast_data: dict,
+        lunch_data: dict,
+        entrees_only: bool
+    ) -> dict:
+        """Assemble the daily menu dict from raw breakfast/lunch responses."""
+        date_str = date.isoformat()
 
         if entrees_only:
             breakfast_items = self.get_entrees_only(breakfast_data, date_str)
@@ -163,7 +378,7 @@ class NutrisliceClient:
 
         return {
             "date": date_str,
-            "day_of_week": date.strftime("%A"),
+            "day_of_week": WEEKDAYS[date.weekday()],
             "breakfast": breakfast_items,
             "lunch": lunch_items
         }
@@ -171,15 +386,12 @@ class NutrisliceClient:
 
 def format_menu_text(menu: dict) -> str:
     """Format menu data as readable text."""
-    lines = [
-        f"📅 {menu['day_of_week']}, {menu['date']}",
-        ""
-    ]
+    bullet = "   • {}".format
+    lines = [f"📅 {menu['day_of_week']}, {menu['date']}", ""]
 
     if menu["breakfast"]:
         lines.append("🥣 Breakfast:")
-        for item in menu["breakfast"]:
-            lines.append(f"   • {item}")
+        lines.extend(map(bullet, menu["breakfast"]))
     else:
         lines.append("🥣 Breakfast: No menu available")
 
@@ -187,8 +399,7 @@ def format_menu_text(menu: dict) -> str:
 
     if menu["lunch"]:
         lines.append("🍽️  Lunch:")
-        for item in menu["lunch"]:
-            lines.append(f"   • {item}")
+        lines.extend(map(bullet, menu["lunch"]))
     else:
         lines.append("🍽️  Lunch: No menu available")
 
@@ -197,15 +408,18 @@ def format_menu_text(menu: dict) -> str:
 
 def format_menu_compact(menu: dict) -> str:
     """Format menu in a compact single-line format."""
-    breakfast = ", ".join(menu["breakfast"][:3]) if menu["breakfast"] else "None"
-    lunch = ", ".join(menu["lunch"][:3]) if menu["lunch"] else "None"
+    return f"{menu['day_of_week']}: 🥣 {_summarize(menu['breakfast'])} | 🍽️ {_summarize(menu['lunch'])}"
 
-    if len(menu["breakfast"]) > 3:
-        breakfast += f" (+{len(menu['breakfast']) - 3} more)"
-    if len(menu["lunch"]) > 3:
-        lunch += f" (+{len(menu['lunch']) - 3} more)"
 
-    return f"{menu['day_of_week']}: 🥣 {breakfast} | 🍽️ {lunch}"
+def _summarize(items: list[str], limit: int = 3) -> str:
+    """Join the first few items, noting how many were left out."""
+    if not items:
+        return "None"
+    summary = ", ".join(items[:limit])
+    extra = len(items) - limit
+    if extra > 0:
+        summary += f" (+{extra} more)"
+    return summary
 
 
 def list_schools(client: NutrisliceClient) -> None:
@@ -216,7 +430,7 @@ def list_schools(client: NutrisliceClient) -> None:
         print("Check that the district slug is correct.", file=sys.stderr)
         return
 
-    print(f"Schools in '{client.district}' ({len(schools)} total):\n")
+    chunks = [f"Schools in '{client.district}' ({len(schools)} total):\n\n"]
 
     # Group by type based on slug patterns
     high = []
@@ -224,31 +438,32 @@ def list_schools(client: NutrisliceClient) -> None:
     elementary = []
     other = []
 
-    for school in sorted(schools, key=lambda s: s["name"]):
+    buckets = (("high-school", high), ("middle-school", middle), ("elementary", elementary))
+
+    for school in sorted(schools, key=itemgetter("name")):
         slug = school["slug"]
-        name = school["name"]
-        entry = (slug, name)
-
-        if "high-school" in slug:
-            high.append(entry)
-        elif "middle-school" in slug:
-            middle.append(entry)
-        elif "elementary" in slug:
-            elementary.append(entry)
+        entry = (slug, school["name"])
+
+        for token, bucket in buckets:
+            if token in slug:
+                bucket.append(entry)
+                break
         else:
             other.append(entry)
 
-    def print_section(title: str, items: list[tuple[str, str]]) -> None:
+    sections = (
+        ("HIGH SCHOOLS", high),
+        ("MIDDLE SCHOOLS", middle),
+        ("ELEMENTARY SCHOOLS", elementary),
+        ("OTHER", other),
+    )
+    for title, items in sections:
         if items:
-            print(f"{title}:")
-            for slug, name in items:
-                print(f"  {slug:45} {name}")
-            print()
+            body = "\n".join(f"  {slug:45} {name}" for slug, name in items)
+            chunks.append(f"{title}:\n{body}\n\n")
 
-    print_section("HIGH SCHOOLS", high)
-    print_section("MIDDLE SCHOOLS", middle)
-    print_section("ELEMENTARY SCHOOLS", elementary)
-    print_section("OTHER", other)
+    # One write for the whole listing instead of a print() per line
+    sys.stdout.write("".join(chunks))
 
 
 def main():
@@ -305,6 +520,12 @@ Finding your district:
         help="Get this week's menus (Mon-Fri)"
     )
 
+    parser.add_argument(
+        "--exact", "-x",
+        action="store_true",
+        help="Treat school as an exact slug and skip looking it up"
+    )
+
     parser.add_argument(
         "--entrees", "-e",
         action="store_true",
@@ -329,76 +550,75 @@ Finding your district:
         help="Show raw API response (for debugging)"
     )
 
-    args = parser.parse_args()
-
-    client = NutrisliceClient(args.district)
-
-    # Handle --list-schools
-    if args.list_schools:
-        list_schools(client)
-        return
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk schools cache and always re-download"
+    )
 
-    # Require school if not listing
-    if not args.school:
-        parser.error("school is required (or use --list-schools)")
+    args = parser.parse_args()
 
-    # Resolve school name
-    school = client.resolve_school(args.school)
-    if not school:
-        print(f"Could not find school matching '{args.school}'", file=sys.stderr)
-        print(f"Use --list-schools to see available schools in '{args.district}'", file=sys.stderr)
-        sys.exit(1)
+    with NutrisliceClient(args.district, use_cache=not args.no_cache) as client:
+        # Handle --list-schools
+        if args.list_schools:
+            list_schools(client)
+            return
 
-    # Determine target date(s)
-    today = datetime.now()
+        # Require school if not listing
+        if not args.school:
+            parser.error("school is required (or use --list-schools)")
 
-    if args.date:
-        try:
-            target_date = datetime.strptime(args.date, "%Y-%m-%d")
-        except ValueError:
-            print(f"Invalid date format: {args.date}. Use YYYY-MM-DD.", file=sys.stderr)
-            sys.exit(1)
-        dates = [target_date]
-    elif args.tomorrow:
-        dates = [today + timedelta(days=1)]
-    elif args.week:
-        # On weekends (Sat=5, Sun=6), show next week instead of the past week
-        if today.weekday() >= 5:
-            # Calculate next Monday
-            days_until_monday = 7 - today.weekday()
-            monday = today + timedelta(days=days_until_monday)
+        # Resolve school name (--exact trusts the slug and skips the schools lookup)
+        if args.exact:
+            school = args.school.strip()
         else:
-            monday = today - timedelta(days=today.weekday())
-        dates = [monday + timedelta(days=i) for i in range(5)]
-    else:
-        dates = [today]
-
-    if args.raw:
-        for date in dates:
-            print(f"\n=== Raw API Response for {date.strftime('%Y-%m-%d')} ===")
-            lunch_data = client.fetch_menu(school, "lunch", date)
-            print(json.dumps(lunch_data, indent=2))
-        return
-
-    menus = []
-    for date in dates:
-        menu = client.get_daily_menu(school, date, entrees_only=args.entrees)
-        menus.append(menu)
+            school = client.resolve_school(args.school)
+        if not school:
+            print(f"Could not find school matching '{args.school}'", file=sys.stderr)
+            print(f"Use --list-schools to see available schools in '{args.district}'", file=sys.stderr)
+            sys.exit(1)
 
-    # Output
-    if args.json:
-        if len(menus) == 1:
-            print(json.dumps(menus[0], indent=2))
+        # Determine target date(s)
+        today = dt.date.today()
+
+        if args.date:
+            try:
+                target_date = dt.datetime.strptime(args.date, "%Y-%m-%d").date()
+            except ValueError:
+                print(f"Invalid date format: {args.date}. Use YYYY-MM-DD.", file=sys.stderr)
+                sys.exit(1)
+            dates = [target_date]
+        elif args.tomorrow:
+            dates = [today + dt.timedelta(days=1)]
+        elif args.week:
+            # On weekends (Sat=5, Sun=6), show next week instead of the past week
+            if today.weekday() >= 5:
+                # Calculate next Monday
+                days_until_monday = 7 - today.weekday()
+                monday = today + dt.timedelta(days=days_until_monday)
+            else:
+                monday = today - dt.timedelta(days=today.weekday())
+            dates = [monday + dt.timedelta(days=i) for i in range(5)]
         else:
-            print(json.dumps(menus, indent=2))
-    elif args.compact:
-        for menu in menus:
-            print(format_menu_compact(menu))
-    else:
-        for i, menu in enumerate(menus):
-            if i > 0:
-                print("\n" + "─" * 40 + "\n")
-            print(format_menu_text(menu))
+            dates = [today]
+
+        if args.raw:
+            for date in dates:
+                print(f"\n=== Raw API Response for {date.isoformat()} ===")
+                lunch_data = client.fetch_menu(school, "lunch", date)
+                print(json_dumps(lunch_data))
+            return
+
+        menus = client.get_menus(school, dates, entrees_only=args.entrees)
+
+        # Output (built up front and written in one go)
+        if args.json:
+            output = json_dumps(menus[0] if len(menus) == 1 else menus)
+        elif args.compact:
+            output = "\n".join(map(format_menu_compact, menus))
+        else:
+            output = f"\n\n{'─' * 40}\n\n".join(map(format_menu_text, menus))
+        sys.stdout.write(output + "\n")
 
 
 if __name__ == "__main__":